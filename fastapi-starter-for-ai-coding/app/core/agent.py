@@ -1,25 +1,85 @@
 """Single Pydantic AI agent instance for the Paddy application.
 
-This module defines the vault_agent at module level. Tools register themselves
-by importing vault_agent and using the @vault_agent.tool decorator.
-Tool modules are imported in main.py for side-effect registration.
+This module exposes vault_agent lazily via a module-level ``__getattr__``
+(PEP 562): the agent is built on first access, not at import. Building it
+imports the tool modules, whose @vault_agent.tool decorators register tools
+on the new instance.
+
+By default the application lifespan calls ``warm_up_agent()``, so the agent
+is built before uvicorn serves any request, health probes included, and the
+first chat request does not pay for building it or resolving its model.
+Setting ``AGENT_WARM_UP=false`` skips this: the agent is then built on the
+first chat request, and workers that only answer probes never build it.
 """
 
+from typing import TYPE_CHECKING
+
 from pydantic_ai import Agent
+from pydantic_ai.models import infer_model
 
-from app.core.config import get_settings
+from app.core.config import SETTINGS
 from app.core.dependencies import VaultDependencies
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_agent: Agent[VaultDependencies, str] | None = None
+
+if TYPE_CHECKING:
+    # Provided lazily by __getattr__ below
+    vault_agent: Agent[VaultDependencies, str]
+
+
+def _build() -> Agent[VaultDependencies, str]:
+    """Construct the agent and register its tools."""
+    global _agent
+    # Assign before importing tools: they import vault_agent from this module.
+    _agent = Agent(
+        SETTINGS.model_name,
+        deps_type=VaultDependencies,
+        defer_model_check=True,
+        system_prompt=(
+            "You are Paddy, an AI assistant for managing Obsidian vaults. "
+            "You help users find, read, and organize their notes using natural language. "
+            "Always use the available tools to interact with the vault - "
+            "do not guess file contents or paths."
+        ),
+    )
+    # Imported for its side effect: registers @vault_agent.tool on the agent above
+    import app.features.ping.tools  # noqa: F401  # pyright: ignore[reportUnusedImport]
+
+    return _agent
+
+
+def get_vault_agent() -> Agent[VaultDependencies, str]:
+    """Get the vault agent, building it on first use.
+
+    Returns:
+        The shared vault agent with all tools registered.
+    """
+    if _agent is None:
+        return _build()
+    return _agent
+
+
+def warm_up_agent() -> None:
+    """Build the agent and resolve the model deferred by ``defer_model_check``.
+
+    Resolution mirrors what Pydantic AI does on the first run. If it fails
+    (e.g. the provider API key is not configured), the error is logged and
+    the model stays deferred, so the first run raises it as before.
+    """
+    agent = get_vault_agent()
+    if not isinstance(agent.model, str):
+        return
+    try:
+        agent.model = infer_model(agent.model)
+    except Exception as e:
+        logger.warning("agent.model_warmup_failed", model=agent.model, error=str(e))
+
 
-settings = get_settings()
-
-vault_agent = Agent(
-    settings.model_name,
-    deps_type=VaultDependencies,
-    defer_model_check=True,
-    system_prompt=(
-        "You are Paddy, an AI assistant for managing Obsidian vaults. "
-        "You help users find, read, and organize their notes using natural language. "
-        "Always use the available tools to interact with the vault - "
-        "do not guess file contents or paths."
-    ),
-)
+def __getattr__(name: str) -> Agent[VaultDependencies, str]:
+    """Resolve ``vault_agent`` lazily (PEP 562)."""
+    if name == "vault_agent":
+        return get_vault_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,14 +3,15 @@
 This module provides centralized configuration management:
 - Environment variable loading from .env file
 - Type-safe settings with validation
-- Cached settings instance with @lru_cache
+- Module-level settings singleton created once at import
 - Settings for application, CORS, and future database configuration
 """
 
-from functools import lru_cache
+from functools import cached_property
 from pathlib import Path
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dotenv import load_dotenv
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -18,14 +19,14 @@ class Settings(BaseSettings):
 
     All settings can be overridden via environment variables.
     Environment variables are case-insensitive.
-    Settings are loaded from .env file if present.
+    The .env file is loaded into os.environ once at import (see below),
+    so instances only read the process environment.
     """
 
     model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
+        # .env is applied via load_dotenv(); skip pydantic-settings' dotenv source
+        env_file=None,
         case_sensitive=False,
-        # Don't fail if .env file doesn't exist
         extra="ignore",
     )
 
@@ -39,6 +40,8 @@ class Settings(BaseSettings):
     llm_provider: str = "openai"
     llm_model: str = "gpt-4.1-nano"
     llm_api_key: str = ""
+    # Build the agent during startup; disable to build it on the first chat request
+    agent_warm_up: bool = True
 
     # Vault configuration
     obsidian_vault_path: Path = Path("/vault")
@@ -49,20 +52,41 @@ class Settings(BaseSettings):
     # CORS settings
     allowed_origins: list[str] = ["app://obsidian.md", "capacitor://localhost"]
 
-    @property
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],  # noqa: ARG003
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,  # noqa: ARG003
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Resolve fields from init kwargs, os.environ and secrets only.
+
+        The dotenv source re-scans the whole environment on every
+        instantiation even without an env_file, so it is dropped.
+        """
+        return init_settings, env_settings, file_secret_settings
+
+    @cached_property
     def model_name(self) -> str:
-        """Build provider:model string used by Pydantic AI."""
+        """Build provider:model string used by Pydantic AI, once per instance."""
         return f"{self.llm_provider}:{self.llm_model}"
 
 
-@lru_cache
+# Existing environment variables take precedence over .env values
+load_dotenv(".env", override=False)
+
+SETTINGS = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance.
+    """Get the settings singleton.
 
-    The @lru_cache decorator ensures settings are only loaded once
-    and reused across the application lifecycle.
+    Settings are loaded once at import and reused across the application
+    lifecycle. Hot paths can import ``SETTINGS`` directly instead.
 
     Returns:
         The application settings instance.
     """
-    return Settings()
+    return SETTINGS
@@ -4,12 +4,14 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VaultDependencies:
     """Dependencies injected into agent tools via RunContext.
 
     Tools access these via ctx.deps.vault_path to locate the Obsidian vault.
     Extended in later phases with VaultManager and other shared services.
+    Frozen and slotted: no per-instance ``__dict__``, and instances are
+    hashable so they can key per-vault caches.
     """
 
     vault_path: Path
@@ -1,9 +1,9 @@
 """Custom exception classes and global exception handlers."""
 
-from typing import Any, cast
+from typing import ClassVar
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.core.logging import get_logger
 
@@ -11,7 +11,13 @@ logger = get_logger(__name__)
 
 
 class PaddyError(Exception):
-    """Base exception for Paddy application errors."""
+    """Base exception for Paddy application errors.
+
+    Subclasses set ``status_code`` to choose the HTTP status returned by
+    ``paddy_exception_handler``.
+    """
+
+    status_code: ClassVar[int] = status.HTTP_500_INTERNAL_SERVER_ERROR
 
 
 class VaultError(PaddyError):
@@ -21,12 +27,16 @@ class VaultError(PaddyError):
 class NoteNotFoundError(VaultError):
     """Exception raised when a note is not found."""
 
+    status_code = status.HTTP_404_NOT_FOUND
+
 
 class VaultPathError(VaultError):
     """Exception raised when a vault path is invalid."""
 
+    status_code = status.HTTP_400_BAD_REQUEST
 
-async def paddy_exception_handler(request: Request, exc: PaddyError) -> JSONResponse:
+
+async def paddy_exception_handler(request: Request, exc: PaddyError) -> ORJSONResponse:
     """Handle Paddy exceptions globally."""
     logger.error(
         "vault.exception_raised",
@@ -37,25 +47,18 @@ async def paddy_exception_handler(request: Request, exc: PaddyError) -> JSONResp
         exc_info=True,
     )
 
-    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-    if isinstance(exc, NoteNotFoundError):
-        status_code = status.HTTP_404_NOT_FOUND
-    elif isinstance(exc, VaultPathError):
-        status_code = status.HTTP_400_BAD_REQUEST
-
-    return JSONResponse(
-        status_code=status_code,
+    return ORJSONResponse(
+        status_code=exc.status_code,
         content={"error": str(exc), "type": type(exc).__name__},
     )
 
 
 def setup_exception_handlers(app: FastAPI) -> None:
-    """Register global exception handlers with the FastAPI application."""
-    # FastAPI expects handler signatures that match the registered exception type.
-    # We intentionally reuse one polymorphic handler across related exception classes.
-    handler: Any = cast(Any, paddy_exception_handler)
-
-    app.add_exception_handler(PaddyError, handler)
-    app.add_exception_handler(VaultError, handler)
-    app.add_exception_handler(NoteNotFoundError, handler)
-    app.add_exception_handler(VaultPathError, handler)
+    """Register global exception handlers with the FastAPI application.
+
+    Starlette resolves handlers by walking ``type(exc).__mro__``, so the
+    single ``PaddyError`` registration covers every subclass.
+    """
+    # The decorator form is typed with a TypeVar, so the narrowed
+    # (Request, PaddyError) signature type-checks without a cast.
+    app.exception_handler(PaddyError)(paddy_exception_handler)
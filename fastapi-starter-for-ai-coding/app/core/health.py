@@ -1,16 +1,25 @@
-"""Health check endpoints for monitoring application status."""
+"""Health check payload for monitoring application status.
 
-from fastapi import APIRouter
+Probes are answered by ``HealthCheckInterceptor`` in ``health_interceptor.py``
+before requests reach FastAPI, so this module no longer registers a route.
+The serialized probe body is cached for ``HEALTH_CACHE_TTL_SECONDS``.
+"""
+
+import time
+
+import orjson
 
 from app.core.config import get_settings
 
-# Health check endpoints are typically at root (no prefix)
-router = APIRouter(tags=["health"])
+HEALTH_CACHE_TTL_SECONDS = 30.0
+
+# (built_at, body) from time.monotonic(). Reads and writes are lock-free:
+# a concurrent rebuild produces identical bytes, so a lost write is harmless.
+_cache: tuple[float, bytes] | None = None
 
 
-@router.get("/health")
 async def health_check() -> dict[str, str]:
-    """Basic health check endpoint.
+    """Basic health check payload.
 
     Returns:
         dict: Health status of the API service.
@@ -18,5 +27,24 @@ async def health_check() -> dict[str, str]:
     Example response:
         {"status": "healthy", "service": "api"}
     """
-    settings = get_settings()
-    return {"status": "healthy", "service": "paddy", "version": settings.version}
+    return {"status": "healthy", "service": "paddy", "version": get_settings().version}
+
+
+def get_health_body() -> bytes:
+    """Get the serialized health response, rebuilding it once the TTL expires.
+
+    Returns:
+        bytes: JSON-encoded health payload.
+    """
+    global _cache
+    now = time.monotonic()
+    cached = _cache
+    if cached is not None and now - cached[0] < HEALTH_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    # Settings are read on each rebuild, so the TTL bounds how stale the payload can be
+    body = orjson.dumps(
+        {"status": "healthy", "service": "paddy", "version": get_settings().version}
+    )
+    _cache = (now, body)
+    return body
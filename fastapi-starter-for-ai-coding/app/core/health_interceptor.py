@@ -0,0 +1,83 @@
+"""Pure ASGI interceptor that answers health probes before FastAPI.
+
+Kubernetes and Obsidian poll ``/health`` far more often than any other
+endpoint. Routing those probes through the middleware stack, route matching
+and response serialization is wasted work for a static payload, so this
+interceptor wraps the FastAPI application and short-circuits ``/health``
+with a cached, pre-serialized body. Health requests still get the
+application's CORS policy, including preflights, since Obsidian fetches
+``/health`` cross-origin. All other traffic is passed through untouched.
+"""
+
+import orjson
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.health import HEALTH_CACHE_TTL_SECONDS, get_health_body
+from app.core.middleware import cors_options
+
+HEALTH_PATH = "/health"
+
+_CACHE_CONTROL = f"max-age={int(HEALTH_CACHE_TTL_SECONDS)}, public".encode()
+
+
+class HealthCheckInterceptor:
+    """ASGI wrapper that serves ``GET /health`` without entering FastAPI.
+
+    The response body comes from ``get_health_body()``, which caches the
+    serialized payload for ``HEALTH_CACHE_TTL_SECONDS``; the same TTL is
+    advertised to monitors via ``Cache-Control``. Non-GET requests to
+    ``/health`` receive a 405 response, except CORS preflights, which
+    ``CORSMiddleware`` answers.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application and precompute the 405 response.
+
+        Args:
+            app: The ASGI application to forward non-health traffic to.
+        """
+        self.app = app
+        self._health_app = CORSMiddleware(self._serve_health, **cors_options())
+        self._not_allowed_body = orjson.dumps({"detail": "Method Not Allowed"})
+        self._not_allowed_headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(self._not_allowed_body)).encode()),
+            (b"allow", b"GET"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer health probes directly and forward everything else.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] == "http" and scope["path"] == HEALTH_PATH:
+            await self._health_app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    async def _serve_health(self, scope: Scope, _receive: Receive, send: Send) -> None:
+        """Send the health response, or 405 for methods other than GET."""
+        if scope["method"] == "GET":
+            body = get_health_body()
+            headers = [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"cache-control", _CACHE_CONTROL),
+            ]
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 405,
+                "headers": self._not_allowed_headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": self._not_allowed_body})
@@ -9,6 +9,7 @@ This module provides:
 
 import time
 from collections.abc import Awaitable, Callable
+from typing import Any
 
 from fastapi import FastAPI, Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -98,16 +99,25 @@ def setup_middleware(app: FastAPI) -> None:
     Args:
         app: The FastAPI application instance.
     """
-    settings = get_settings()
-
     # Add request logging middleware
     app.add_middleware(RequestLoggingMiddleware)
 
     # Add CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.allowed_origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    app.add_middleware(CORSMiddleware, **cors_options())
+
+
+def cors_options() -> dict[str, Any]:
+    """Build the CORSMiddleware keyword arguments from settings.
+
+    Shared with ``HealthCheckInterceptor``, which answers ``/health``
+    outside this middleware stack and applies the same policy itself.
+
+    Returns:
+        Keyword arguments for ``CORSMiddleware``.
+    """
+    return {
+        "allow_origins": get_settings().allowed_origins,
+        "allow_credentials": True,
+        "allow_methods": ["*"],
+        "allow_headers": ["*"],
+    }
@@ -1,21 +1,70 @@
 """Tests for Pydantic AI agent setup."""
 
-import importlib
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
 
-from app.core.agent import vault_agent
+import pytest
+from pydantic_ai import Agent
+
+from app.core.agent import get_vault_agent, warm_up_agent
 from app.core.dependencies import VaultDependencies
 
-importlib.import_module("app.features.ping.tools")
+_PROJECT_ROOT = Path(__file__).parents[3]
+
+
+@pytest.fixture(scope="module")
+def vault_agent() -> Agent[VaultDependencies, str]:
+    """Build the agent once; building it imports and registers the tool modules."""
+    return get_vault_agent()
+
+
+def test_vault_agent_not_built_on_import():
+    # A fresh interpreter: other tests in this session build the agent
+    code = "import app.core.agent, app.main; assert app.core.agent._agent is None"
 
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=_PROJECT_ROOT)  # noqa: S603 - fixed code
 
-def test_vault_agent_exists():
+
+def test_vault_agent_exists(vault_agent: Agent[VaultDependencies, str]) -> None:
     assert vault_agent is not None
 
 
-def test_vault_agent_has_deps_type():
+def test_vault_agent_has_deps_type(vault_agent: Agent[VaultDependencies, str]) -> None:
     assert vault_agent._deps_type == VaultDependencies  # pyright: ignore[reportPrivateUsage]
 
 
-def test_vault_agent_has_tools():
+def test_vault_agent_has_tools(vault_agent: Agent[VaultDependencies, str]) -> None:
     tool_names = list(vault_agent._function_tools.keys())  # pyright: ignore[reportPrivateUsage]
     assert "ping" in tool_names
+
+
+def test_warm_up_agent_resolves_model(
+    vault_agent: Agent[VaultDependencies, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    resolved = MagicMock()
+    monkeypatch.setattr(vault_agent, "model", "openai:gpt-4.1-nano")
+
+    def resolve(_name: str) -> MagicMock:
+        return resolved
+
+    monkeypatch.setattr("app.core.agent.infer_model", resolve)
+
+    warm_up_agent()
+
+    assert vault_agent.model is resolved
+
+
+def test_warm_up_agent_keeps_model_deferred_on_failure(
+    vault_agent: Agent[VaultDependencies, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail(_name: str) -> None:
+        raise RuntimeError("missing API key")
+
+    monkeypatch.setattr(vault_agent, "model", "openai:gpt-4.1-nano")
+    monkeypatch.setattr("app.core.agent.infer_model", fail)
+
+    warm_up_agent()
+
+    assert vault_agent.model == "openai:gpt-4.1-nano"
@@ -4,7 +4,9 @@ import os
 from pathlib import Path
 from unittest.mock import patch
 
-from app.core.config import Settings, get_settings
+import pytest
+
+from app.core.config import SETTINGS, Settings, get_settings
 
 
 def create_settings() -> Settings:
@@ -41,6 +43,7 @@ def test_settings_defaults() -> None:
         assert settings.environment == "development"
         assert settings.log_level == "INFO"
         assert settings.llm_provider == "openai"
+        assert settings.agent_warm_up is True
         assert settings.obsidian_vault_path == Path("/vault")
         assert "app://obsidian.md" in settings.allowed_origins
         assert "capacitor://localhost" in settings.allowed_origins
@@ -97,16 +100,22 @@ def test_allowed_origins_parsing() -> None:
         assert "http://test.com" in settings.allowed_origins
 
 
-def test_get_settings_caching() -> None:
-    """Test get_settings() returns cached instance."""
-    # Clear the cache first
-    get_settings.cache_clear()
+def test_settings_do_not_read_env_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test Settings relies on os.environ instead of parsing .env itself."""
+    (tmp_path / ".env").write_text("APP_NAME=From Dotenv\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("APP_NAME", raising=False)
+
+    settings = create_settings()
 
-    settings1 = get_settings()
-    settings2 = get_settings()
+    assert Settings.model_config.get("env_file") is None
+    assert settings.app_name == "Paddy"
 
-    # Should return the same instance (cached)
-    assert settings1 is settings2
+
+def test_get_settings_caching() -> None:
+    """Test get_settings() returns the module-level singleton."""
+    assert get_settings() is SETTINGS
+    assert get_settings() is get_settings()
 
 
 def test_settings_case_insensitive() -> None:
@@ -1,10 +1,12 @@
 """Unit tests for custom exceptions and exception handlers."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
-from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
 
 from app.core.exceptions import (
     NoteNotFoundError,
@@ -14,6 +16,7 @@ from app.core.exceptions import (
     paddy_exception_handler,
     setup_exception_handlers,
 )
+from app.core.logging import set_request_id, setup_logging
 
 
 def test_paddy_error_is_exception() -> None:
@@ -55,6 +58,14 @@ def test_vault_path_error_inherits_from_vault_error() -> None:
         raise VaultPathError("Path is invalid")
 
 
+def test_exception_status_codes() -> None:
+    """Test that each exception class declares its HTTP status code."""
+    assert PaddyError.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert VaultError.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert NoteNotFoundError.status_code == status.HTTP_404_NOT_FOUND
+    assert VaultPathError.status_code == status.HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.asyncio
 async def test_paddy_exception_handler_logs_and_returns_json() -> None:
     """Test that the exception handler logs errors and returns proper JSON."""
@@ -72,7 +83,7 @@ async def test_paddy_exception_handler_logs_and_returns_json() -> None:
         assert call_kwargs["error_type"] == "PaddyError"
         assert call_kwargs["error_message"] == "Test paddy error"
 
-    assert isinstance(response, JSONResponse)
+    assert isinstance(response, ORJSONResponse)
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
     assert response.body is not None
 
@@ -105,14 +116,54 @@ async def test_paddy_exception_handler_returns_400_for_path_error() -> None:
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
+@pytest.mark.asyncio
+async def test_paddy_exception_handler_logs_with_configured_processors(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test the handler logs through the configuration applied at startup.
+
+    The module is imported before setup_logging() runs, so the logger must
+    be resolved at call time rather than bound at import.
+    """
+    setup_logging(log_level="INFO")
+    set_request_id("exception-request-id")
+    mock_request = MagicMock(spec=Request)
+    mock_request.url.path = "/test/path"
+    mock_request.method = "GET"
+
+    await paddy_exception_handler(mock_request, NoteNotFoundError("Missing note"))
+
+    log_data = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert log_data["event"] == "vault.exception_raised"
+    assert log_data["level"] == "error"
+    assert log_data["request_id"] == "exception-request-id"
+
+
 def test_setup_exception_handlers_registers_handlers() -> None:
-    """Test that setup_exception_handlers registers all exception handlers."""
-    mock_app = MagicMock()
-    setup_exception_handlers(mock_app)
-
-    assert mock_app.add_exception_handler.call_count == 4
-    call_args_list = [call[0][0] for call in mock_app.add_exception_handler.call_args_list]
-    assert PaddyError in call_args_list
-    assert VaultError in call_args_list
-    assert NoteNotFoundError in call_args_list
-    assert VaultPathError in call_args_list
+    """Test that setup_exception_handlers registers one handler for the base class."""
+    app = FastAPI()
+    setup_exception_handlers(app)
+
+    registered = [
+        key
+        for key in app.exception_handlers
+        if isinstance(key, type) and issubclass(key, PaddyError)
+    ]
+    assert registered == [PaddyError]
+    assert app.exception_handlers[PaddyError] is paddy_exception_handler
+
+
+def test_base_handler_catches_subclasses() -> None:
+    """Test that the PaddyError handler is found for subclasses via the MRO."""
+    app = FastAPI()
+    setup_exception_handlers(app)
+
+    @app.get("/missing")
+    def missing_endpoint() -> None:
+        raise NoteNotFoundError("Missing note")
+
+    with patch("app.core.exceptions.logger.error"):
+        response = TestClient(app).get("/missing")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"error": "Missing note", "type": "NoteNotFoundError"}
@@ -1,8 +1,13 @@
 """Unit tests for health check endpoints."""
 
+import json
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
 import pytest
 
-from app.core.health import health_check
+from app.core import health
+from app.core.health import HEALTH_CACHE_TTL_SECONDS, get_health_body, health_check
 
 
 @pytest.mark.asyncio
@@ -13,3 +18,54 @@ async def test_health_check_returns_healthy() -> None:
     assert response["status"] == "healthy"
     assert response["service"] == "paddy"
     assert "version" in response
+
+
+@pytest.fixture
+def reset_health_cache() -> Iterator[None]:
+    """Clear the cached health body before and after a test."""
+    health._cache = None  # pyright: ignore[reportPrivateUsage]
+    yield
+    health._cache = None  # pyright: ignore[reportPrivateUsage]
+
+
+def test_get_health_body_serializes_payload(reset_health_cache: None) -> None:
+    """Test that the cached body matches the health check payload."""
+    body = get_health_body()
+
+    data = json.loads(body)
+    assert data["status"] == "healthy"
+    assert data["service"] == "paddy"
+    assert "version" in data
+
+
+def test_get_health_body_reuses_cached_bytes(reset_health_cache: None) -> None:
+    """Test that the body is reused while the TTL has not expired."""
+    with patch("app.core.health.time.monotonic", return_value=1000.0):
+        first = get_health_body()
+    with patch("app.core.health.time.monotonic", return_value=1000.0 + 29.0):
+        second = get_health_body()
+
+    assert second is first
+
+
+def test_get_health_body_rebuilds_after_ttl(reset_health_cache: None) -> None:
+    """Test that the body is rebuilt once the TTL expires."""
+    with patch("app.core.health.time.monotonic", return_value=1000.0):
+        first = get_health_body()
+    with patch("app.core.health.time.monotonic", return_value=1000.0 + HEALTH_CACHE_TTL_SECONDS):
+        second = get_health_body()
+
+    assert second == first
+    assert second is not first
+
+
+def test_get_health_body_reads_settings_on_rebuild(reset_health_cache: None) -> None:
+    """Test that a rebuild picks up the current settings version."""
+    settings = MagicMock(version="9.9.9")
+    with (
+        patch("app.core.health.get_settings", return_value=settings),
+        patch("app.core.health.time.monotonic", return_value=1000.0),
+    ):
+        body = get_health_body()
+
+    assert json.loads(body)["version"] == "9.9.9"
@@ -0,0 +1,80 @@
+"""Unit tests for the health check ASGI interceptor."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.health_interceptor import HealthCheckInterceptor
+from app.main import application
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Create a test client for an interceptor-wrapped application."""
+    inner_app = FastAPI()
+
+    @inner_app.get("/other")
+    def other_endpoint() -> dict[str, str]:
+        return {"message": "passed through"}
+
+    return TestClient(HealthCheckInterceptor(inner_app))
+
+
+def test_health_get_returns_healthy(client: TestClient) -> None:
+    """Test GET /health is answered by the interceptor."""
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["cache-control"] == "max-age=30, public"
+    data = response.json()
+    assert data["status"] == "healthy"
+    assert data["service"] == "paddy"
+    assert "version" in data
+
+
+def test_health_non_get_returns_405(client: TestClient) -> None:
+    """Test non-GET methods on /health are rejected with Allow: GET."""
+    response = client.post("/health")
+
+    assert response.status_code == 405
+    assert response.headers["allow"] == "GET"
+    assert response.json() == {"detail": "Method Not Allowed"}
+
+
+def test_other_paths_pass_through(client: TestClient) -> None:
+    """Test non-health requests reach the wrapped application."""
+    response = client.get("/other")
+
+    assert response.status_code == 200
+    assert response.json() == {"message": "passed through"}
+
+
+def test_health_skips_wrapped_app_middleware() -> None:
+    """Test the interceptor answers before application middleware runs."""
+    response = TestClient(application).get("/health")
+
+    assert response.status_code == 200
+    assert "X-Request-ID" not in response.headers
+
+
+def test_health_applies_cors_policy(client: TestClient) -> None:
+    """Test cross-origin health probes get the configured CORS headers."""
+    response = client.get("/health", headers={"Origin": "app://obsidian.md"})
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "app://obsidian.md"
+
+
+def test_health_answers_cors_preflight(client: TestClient) -> None:
+    """Test CORS preflights to /health succeed instead of returning 405."""
+    response = client.options(
+        "/health",
+        headers={
+            "Origin": "app://obsidian.md",
+            "Access-Control-Request-Method": "GET",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "app://obsidian.md"
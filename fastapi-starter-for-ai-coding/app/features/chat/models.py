@@ -2,12 +2,13 @@
 
 These models define the request and response schema for the
 POST /v1/chat/completions endpoint, matching the OpenAI chat
-completion format that Obsidian Copilot expects.
+completion format that Obsidian Copilot expects. All models are
+frozen: they are built once per request and never mutated.
 """
 
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ContentPart(BaseModel):
@@ -17,6 +18,8 @@ class ContentPart(BaseModel):
     For text-only messages, Copilot sends content as a plain string.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     type: str
     text: str | None = None
     image_url: dict[str, Any] | None = None
@@ -30,6 +33,8 @@ class ChatMessage(BaseModel):
     property normalizes both formats to a plain string.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     role: Literal["system", "user", "assistant"]
     content: str | list[ContentPart]
 
@@ -42,7 +47,8 @@ class ChatMessage(BaseModel):
         """
         if isinstance(self.content, str):
             return self.content
-        return "".join(part.text for part in self.content if part.type == "text" and part.text)
+        # A list, not a generator: str.join materializes its input anyway
+        return "".join([part.text for part in self.content if part.type == "text" and part.text])
 
 
 class ChatCompletionRequest(BaseModel):
@@ -53,6 +59,8 @@ class ChatCompletionRequest(BaseModel):
     but not forwarded to the agent in the MVP.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     model: str
     messages: list[ChatMessage]
     stream: bool = False
@@ -65,6 +73,8 @@ class ChatCompletionRequest(BaseModel):
 class ResponseMessage(BaseModel):
     """Assistant message returned inside a chat completion choice."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     role: Literal["assistant"] = "assistant"
     content: str
 
@@ -72,6 +82,8 @@ class ResponseMessage(BaseModel):
 class Choice(BaseModel):
     """A single completion choice in the response."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     index: int = 0
     message: ResponseMessage
     finish_reason: Literal["stop", "length"] = "stop"
@@ -80,6 +92,8 @@ class Choice(BaseModel):
 class Usage(BaseModel):
     """Token usage statistics for the completion."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
@@ -91,6 +105,8 @@ class ChatCompletionResponse(BaseModel):
     Matches the format expected by Obsidian Copilot and the OpenAI SDK.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     object: Literal["chat.completion"] = "chat.completion"
     created: int
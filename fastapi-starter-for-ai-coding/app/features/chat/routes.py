@@ -2,17 +2,26 @@
 
 This module implements the OpenAI-compatible chat completions endpoint
 that Obsidian Copilot connects to. It handles API key authentication,
-message conversion, agent execution via ``agent.iter()``, and response
+message conversion, agent execution via ``agent.run()``, and response
 formatting.
+
+The request body is decoded by ``parse_chat_request`` straight from the
+raw bytes with pydantic-core, rather than by FastAPI's ``json.loads`` plus
+dict validation.
 """
 
+import logging
 import time
+from hmac import compare_digest
+from typing import Any, cast
 
-from fastapi import APIRouter, HTTPException, Security, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, Security, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import ValidationError
 
-from app.core.agent import vault_agent
-from app.core.config import get_settings
+from app.core.agent import get_vault_agent
+from app.core.config import SETTINGS
 from app.core.dependencies import VaultDependencies
 from app.core.logging import get_logger
 from app.features.chat.models import ChatCompletionRequest, ChatCompletionResponse
@@ -24,6 +33,12 @@ router = APIRouter(prefix="/v1", tags=["chat"])
 
 security = HTTPBearer()
 
+# Encoded once so the per-request check is a single constant-time compare
+_EXPECTED_KEY = SETTINGS.api_key.encode()
+
+# The vault path is fixed at import, so one deps instance serves every run
+_DEPS = VaultDependencies(vault_path=SETTINGS.obsidian_vault_path)
+
 
 async def verify_api_key(
     credentials: HTTPAuthorizationCredentials = Security(security),  # noqa: B008
@@ -39,8 +54,7 @@ async def verify_api_key(
     Raises:
         HTTPException: 401 if the token does not match ``settings.api_key``.
     """
-    settings = get_settings()
-    if credentials.credentials != settings.api_key:
+    if not compare_digest(credentials.credentials.encode(), _EXPECTED_KEY):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
@@ -48,14 +62,123 @@ async def verify_api_key(
     return credentials
 
 
+def _is_json_content_type(content_type: str | None) -> bool:
+    """Apply FastAPI's rule for decoding a body as JSON.
+
+    A missing content type, ``application/json`` and ``application/*+json``
+    are treated as JSON; anything else is not.
+    """
+    if not content_type:
+        return True
+    main_type, _, subtype = content_type.split(";", 1)[0].strip().lower().partition("/")
+    return main_type == "application" and (subtype == "json" or subtype.endswith("+json"))
+
+
+async def parse_chat_request(http_request: Request) -> ChatCompletionRequest:
+    """Decode and validate the chat completion body in a single pass.
+
+    Args:
+        http_request: The incoming request.
+
+    Returns:
+        The validated chat completion request.
+
+    Raises:
+        HTTPException: 400 if a JSON body is not valid UTF-8.
+        RequestValidationError: 422 if the body is missing, is not valid
+            JSON, is sent with a non-JSON content type, or does not match
+            ``ChatCompletionRequest``.
+    """
+    body = await http_request.body()
+    if not body:
+        raise RequestValidationError(
+            [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+        )
+    try:
+        if _is_json_content_type(http_request.headers.get("content-type")):
+            return ChatCompletionRequest.model_validate_json(body)
+        # Like FastAPI, leave other bodies undecoded so the raw bytes fail validation
+        return ChatCompletionRequest.model_validate(body, from_attributes=True)
+    except ValidationError as e:
+        raise _body_validation_error(e, body) from e
+
+
+def _body_validation_error(error: ValidationError, body: bytes) -> RequestValidationError:
+    """Convert a pydantic error on the raw body into FastAPI's 422 shape.
+
+    Raw ``bytes`` never reach the 422 handler: ``jsonable_encoder`` would
+    try to decode them, and would echo the whole conversation back.
+
+    Raises:
+        HTTPException: 400 if the body is not valid UTF-8, as FastAPI does.
+    """
+    errors: list[dict[str, Any]] = []
+    for item in error.errors(include_url=False):
+        if item["type"] == "json_invalid":
+            try:
+                body.decode()
+            except UnicodeDecodeError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="There was an error parsing the body",
+                ) from e
+            errors.append(
+                {
+                    "type": "json_invalid",
+                    "loc": ("body",),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": item.get("ctx", {}),
+                }
+            )
+            continue
+        entry: dict[str, Any] = {**item, "loc": ("body", *item["loc"])}
+        if isinstance(entry["input"], bytes):
+            entry["input"] = body.decode(errors="replace")
+        errors.append(entry)
+    return RequestValidationError(errors)
+
+
+def _inline_defs(schema: dict[str, Any]) -> dict[str, Any]:
+    """Inline ``$defs`` references so the schema can live in ``openapi_extra``.
+
+    ``#/$defs/...`` references resolve against the OpenAPI document root,
+    not against the embedded schema, so they are replaced by their targets.
+    """
+    defs: dict[str, Any] = schema.pop("$defs", {})
+
+    def resolve(node: object) -> object:
+        if isinstance(node, dict):
+            mapping = cast(dict[str, object], node)
+            ref = mapping.get("$ref")
+            if isinstance(ref, str):
+                return resolve(defs[ref.rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in mapping.items()}
+        if isinstance(node, list):
+            return [resolve(item) for item in cast(list[object], node)]
+        return node
+
+    return {key: resolve(value) for key, value in schema.items()}
+
+
+# FastAPI no longer sees the body model, so document it explicitly
+_REQUEST_BODY_SCHEMA = _inline_defs(ChatCompletionRequest.model_json_schema())
+
+
 @router.post(
     "/chat/completions",
     response_model=ChatCompletionResponse,
     dependencies=[Security(verify_api_key)],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _REQUEST_BODY_SCHEMA}},
+        },
+    },
 )
 async def chat_completions(
-    request: ChatCompletionRequest,
-) -> ChatCompletionResponse:
+    request: ChatCompletionRequest = Depends(parse_chat_request),  # noqa: B008
+) -> Response:
     """OpenAI-compatible chat completions endpoint.
 
     Accepts a standard OpenAI chat completion request, converts the
@@ -66,13 +189,14 @@ async def chat_completions(
         request: The chat completion request body.
 
     Returns:
-        An OpenAI-compatible chat completion response.
+        An OpenAI-compatible chat completion response, already rendered.
+        ``response_model`` is kept only to document the schema in OpenAPI.
 
     Raises:
         HTTPException: 400 if streaming is requested or messages are invalid.
         HTTPException: 500 if the agent run fails.
     """
-    logger.info(
+    logger.debug(
         "chat.completions.request_received",
         model=request.model,
         message_count=len(request.messages),
@@ -96,25 +220,13 @@ async def chat_completions(
             detail=str(e),
         ) from e
 
-    settings = get_settings()
-    deps = VaultDependencies(vault_path=settings.obsidian_vault_path)
-
-    logger.info(
-        "chat.completions.agent_run_started",
-        user_prompt_length=len(user_prompt),
-        history_length=len(message_history),
-    )
-
-    start = time.time()
+    start = time.monotonic_ns()
     try:
-        async with vault_agent.iter(
+        result = await get_vault_agent().run(
             user_prompt=user_prompt,
             message_history=message_history,
-            deps=deps,
-        ) as agent_run:
-            async for _node in agent_run:
-                pass
-        result = agent_run.result
+            deps=_DEPS,
+        )
     except Exception as e:
         logger.error(
             "chat.completions.request_failed",
@@ -126,20 +238,20 @@ async def chat_completions(
             detail="Agent execution failed. Check server logs for details.",
         ) from e
 
-    if result is None:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Agent returned no result.",
-        )
-
-    duration = time.time() - start
+    duration_ms = (time.monotonic_ns() - start) // 1_000_000
     usage = result.usage()
 
-    logger.info(
-        "chat.completions.response_completed",
-        total_tokens=usage.total_tokens,
-        duration_seconds=round(duration, 3),
-    )
+    # One INFO event per request; skip building the kwargs when INFO is off
+    if logger.is_enabled_for(logging.INFO):
+        logger.info(
+            "chat.completions.response_completed",
+            model=request.model,
+            message_count=len(request.messages),
+            user_prompt_length=len(user_prompt),
+            history_length=len(message_history),
+            total_tokens=usage.total_tokens,
+            duration_ms=duration_ms,
+        )
 
     return build_chat_response(
         output=result.data,
@@ -1,5 +1,8 @@
 """Unit tests for chat feature Pydantic models."""
 
+import pytest
+from pydantic import ValidationError
+
 from app.features.chat.models import (
     ChatCompletionRequest,
     ChatCompletionResponse,
@@ -38,6 +41,17 @@ def test_chat_message_mixed_array_content():
     assert msg.text_content == "What is this?"
 
 
+def test_chat_message_image_only_content():
+    msg = ChatMessage(
+        role="user",
+        content=[
+            ContentPart(type="image_url", image_url={"url": "data:image/png;base64,..."}),
+            ContentPart(type="text"),
+        ],
+    )
+    assert msg.text_content == ""
+
+
 def test_chat_completion_request_defaults():
     req = ChatCompletionRequest(
         model="paddy",
@@ -89,3 +103,18 @@ def test_usage_defaults():
     assert usage.prompt_tokens == 0
     assert usage.completion_tokens == 0
     assert usage.total_tokens == 0
+
+
+def test_models_are_frozen():
+    msg = ChatMessage(role="user", content="Hello")
+    with pytest.raises(ValidationError):
+        msg.content = "Changed"  # pyright: ignore[reportAttributeAccessIssue]
+
+    usage = Usage()
+    with pytest.raises(ValidationError):
+        usage.total_tokens = 1  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_response_models_forbid_extra_fields():
+    with pytest.raises(ValidationError):
+        Usage.model_validate({"prompt_tokens": 1, "cached_tokens": 2})
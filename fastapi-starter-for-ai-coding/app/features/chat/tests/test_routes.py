@@ -1,17 +1,21 @@
 """Unit tests for the chat completions route."""
 
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.dependencies import VaultDependencies
+from app.features.chat import routes
 from app.main import application
 
 TEST_API_KEY = "test-secret-key"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client() -> TestClient:
     return TestClient(application)
 
@@ -32,95 +36,105 @@ def _chat_body(
     }
 
 
-class _MockAgentRun:
-    """Async-iterable mock that simulates an AgentRun."""
+@pytest.fixture
+def patched_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point the route's settings-derived state at a test configuration."""
+    monkeypatch.setattr(routes, "_EXPECTED_KEY", TEST_API_KEY.encode())
+    monkeypatch.setattr(routes, "_DEPS", VaultDependencies(vault_path=Path("/vault")))
+
+
+# Shared request defaults; tests must not mutate them
+_DEFAULT_AUTH = _auth_header()
+_DEFAULT_BODY = _chat_body()
+
 
-    def __init__(self, result: Any) -> None:
-        self.result = result
+@dataclass(slots=True)
+class _FakeUsage:
+    """The usage fields the route reads from ``result.usage()``."""
 
-    def __aiter__(self) -> "_MockAgentRun":
-        return self
+    request_tokens: int = 10
+    response_tokens: int = 5
+    total_tokens: int = 15
 
-    async def __anext__(self) -> None:
-        raise StopAsyncIteration
 
+@dataclass(slots=True)
+class _FakeResult:
+    """Minimal stand-in for the result of ``vault_agent.run()``."""
 
-class _MockAgentContext:
-    """Async context manager mock that simulates ``vault_agent.iter()``."""
+    data: str = "Mocked agent response"
 
-    def __init__(self, result: Any) -> None:
-        self._run = _MockAgentRun(result)
+    def usage(self) -> _FakeUsage:
+        return _FakeUsage()
 
-    async def __aenter__(self) -> _MockAgentRun:
-        return self._run
 
-    async def __aexit__(self, *args: Any) -> bool:
-        return False
+@dataclass(slots=True)
+class _FakeAgent:
+    """Minimal stand-in for ``vault_agent``; ``run()`` fails if ``error`` is set."""
 
+    error: Exception | None = None
 
-def _mock_agent_context() -> _MockAgentContext:
-    """Build a mock for ``vault_agent.iter()`` that simulates a successful run."""
-    mock_usage = MagicMock()
-    mock_usage.request_tokens = 10
-    mock_usage.response_tokens = 5
-    mock_usage.total_tokens = 15
+    async def run(self, **_kwargs: object) -> _FakeResult:
+        if self.error is not None:
+            raise self.error
+        return _FakeResult()
 
-    mock_result = MagicMock()
-    mock_result.data = "Mocked agent response"
-    mock_result.usage.return_value = mock_usage
 
-    return _MockAgentContext(mock_result)
+@pytest.fixture
+def fake_agent(monkeypatch: pytest.MonkeyPatch) -> _FakeAgent:
+    """Serve chat requests from a ``_FakeAgent`` instead of the real agent."""
+    agent = _FakeAgent()
+    monkeypatch.setattr(routes, "get_vault_agent", lambda: agent)
+    return agent
 
 
 def test_chat_completions_requires_auth(client: TestClient) -> None:
-    response = client.post("/v1/chat/completions", json=_chat_body())
+    response = client.post("/v1/chat/completions", json=_DEFAULT_BODY)
     assert response.status_code == 403  # HTTPBearer returns 403 when no header
 
 
+@pytest.mark.usefixtures("patched_settings")
 def test_chat_completions_rejects_bad_key(client: TestClient) -> None:
-    with patch("app.features.chat.routes.get_settings") as mock_settings:
-        mock_settings.return_value.api_key = TEST_API_KEY
-        response = client.post(
-            "/v1/chat/completions",
-            json=_chat_body(),
-            headers=_auth_header("wrong-key"),
-        )
+    response = client.post(
+        "/v1/chat/completions",
+        json=_DEFAULT_BODY,
+        headers=_auth_header("wrong-key"),
+    )
     assert response.status_code == 401
 
 
+@pytest.mark.usefixtures("patched_settings")
+def test_chat_completions_rejects_key_prefix_and_extension(client: TestClient) -> None:
+    truncated = client.post(
+        "/v1/chat/completions",
+        json=_DEFAULT_BODY,
+        headers=_auth_header(TEST_API_KEY[:-1]),
+    )
+    extended = client.post(
+        "/v1/chat/completions",
+        json=_DEFAULT_BODY,
+        headers=_auth_header(TEST_API_KEY + "x"),
+    )
+    assert truncated.status_code == 401
+    assert extended.status_code == 401
+
+
+@pytest.mark.usefixtures("patched_settings", "fake_agent")
 def test_chat_completions_accepts_valid_key(client: TestClient) -> None:
-    settings = MagicMock()
-    settings.api_key = TEST_API_KEY
-    settings.obsidian_vault_path = "/vault"
-
-    with (
-        patch("app.features.chat.routes.get_settings", return_value=settings),
-        patch("app.features.chat.routes.vault_agent") as mock_agent,
-    ):
-        mock_agent.iter.return_value = _mock_agent_context()
-        response = client.post(
-            "/v1/chat/completions",
-            json=_chat_body(),
-            headers=_auth_header(),
-        )
+    response = client.post(
+        "/v1/chat/completions",
+        json=_DEFAULT_BODY,
+        headers=_DEFAULT_AUTH,
+    )
     assert response.status_code == 200
 
 
+@pytest.mark.usefixtures("patched_settings", "fake_agent")
 def test_chat_completions_returns_openai_format(client: TestClient) -> None:
-    settings = MagicMock()
-    settings.api_key = TEST_API_KEY
-    settings.obsidian_vault_path = "/vault"
-
-    with (
-        patch("app.features.chat.routes.get_settings", return_value=settings),
-        patch("app.features.chat.routes.vault_agent") as mock_agent,
-    ):
-        mock_agent.iter.return_value = _mock_agent_context()
-        response = client.post(
-            "/v1/chat/completions",
-            json=_chat_body(),
-            headers=_auth_header(),
-        )
+    response = client.post(
+        "/v1/chat/completions",
+        json=_DEFAULT_BODY,
+        headers=_DEFAULT_AUTH,
+    )
 
     assert response.status_code == 200
     data: dict[str, Any] = response.json()
@@ -140,29 +154,150 @@ def test_chat_completions_returns_openai_format(client: TestClient) -> None:
     assert data["usage"]["total_tokens"] == 15
 
 
-def test_chat_completions_rejects_streaming(client: TestClient) -> None:
-    with patch("app.features.chat.routes.get_settings") as mock_settings:
-        mock_settings.return_value.api_key = TEST_API_KEY
+@pytest.mark.usefixtures("patched_settings", "fake_agent")
+def test_chat_completions_does_not_read_settings_per_request(client: TestClient) -> None:
+    # create=True: the route module only reads SETTINGS at import today
+    with patch("app.features.chat.routes.get_settings", side_effect=AssertionError, create=True):
         response = client.post(
             "/v1/chat/completions",
-            json=_chat_body(stream=True),
-            headers=_auth_header(),
+            json=_DEFAULT_BODY,
+            headers=_DEFAULT_AUTH,
         )
+    assert response.status_code == 200
+
+
+@pytest.mark.usefixtures("patched_settings")
+def test_chat_completions_agent_failure_returns_500(
+    client: TestClient, fake_agent: _FakeAgent
+) -> None:
+    fake_agent.error = RuntimeError("boom")
+    response = client.post(
+        "/v1/chat/completions",
+        json=_DEFAULT_BODY,
+        headers=_DEFAULT_AUTH,
+    )
+    assert response.status_code == 500
+    assert "Agent execution failed" in response.json()["detail"]
+
+
+@pytest.mark.usefixtures("patched_settings", "fake_agent")
+def test_chat_completions_logs_duration_in_ms(client: TestClient) -> None:
+    with patch("app.features.chat.routes.logger") as mock_logger:
+        client.post("/v1/chat/completions", json=_DEFAULT_BODY, headers=_DEFAULT_AUTH)
+
+    completed = [
+        c
+        for c in mock_logger.info.call_args_list
+        if c[0][0] == "chat.completions.response_completed"
+    ]
+    assert len(completed) == 1
+    assert isinstance(completed[0][1]["duration_ms"], int)
+    assert completed[0][1]["message_count"] == 1
+    assert completed[0][1]["user_prompt_length"] == len("Hello")
+    assert mock_logger.info.call_count == 1
+
+
+@pytest.mark.usefixtures("patched_settings")
+def test_chat_completions_rejects_streaming(client: TestClient) -> None:
+    response = client.post(
+        "/v1/chat/completions",
+        json=_chat_body(stream=True),
+        headers=_DEFAULT_AUTH,
+    )
     assert response.status_code == 400
     assert "Streaming not yet supported" in response.json()["detail"]
 
 
+@pytest.mark.usefixtures("patched_settings")
 def test_chat_completions_empty_messages_returns_400(client: TestClient) -> None:
-    with patch("app.features.chat.routes.get_settings") as mock_settings:
-        mock_settings.return_value.api_key = TEST_API_KEY
-        response = client.post(
-            "/v1/chat/completions",
-            json={"model": "paddy", "messages": []},
-            headers=_auth_header(),
-        )
+    response = client.post(
+        "/v1/chat/completions",
+        json={"model": "paddy", "messages": []},
+        headers=_DEFAULT_AUTH,
+    )
     assert response.status_code == 400
 
 
+@pytest.mark.usefixtures("patched_settings")
+def test_chat_completions_invalid_body_returns_422(client: TestClient) -> None:
+    response = client.post(
+        "/v1/chat/completions",
+        json={"model": "paddy", "messages": [{"role": "tool", "content": "x"}]},
+        headers=_DEFAULT_AUTH,
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][:3] == ["body", "messages", 0]
+
+
+@pytest.mark.usefixtures("patched_settings")
+def test_chat_completions_malformed_json_returns_422(client: TestClient) -> None:
+    response = client.post(
+        "/v1/chat/completions",
+        content=b"{not json",
+        headers={**_DEFAULT_AUTH, "Content-Type": "application/json"},
+    )
+    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["type"] == "json_invalid"
+    assert error["input"] == {}
+
+
+@pytest.mark.usefixtures("patched_settings")
+def test_chat_completions_non_utf8_body_returns_400(client: TestClient) -> None:
+    response = client.post(
+        "/v1/chat/completions",
+        content=b'{"model":"\xff"}',
+        headers={**_DEFAULT_AUTH, "Content-Type": "application/json"},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "There was an error parsing the body"
+
+
+@pytest.mark.usefixtures("patched_settings")
+def test_chat_completions_empty_body_returns_422(client: TestClient) -> None:
+    response = client.post(
+        "/v1/chat/completions",
+        headers={**_DEFAULT_AUTH, "Content-Type": "application/json"},
+    )
+    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["type"] == "missing"
+    assert error["loc"] == ["body"]
+
+
+@pytest.mark.usefixtures("patched_settings")
+def test_chat_completions_non_json_content_type_returns_422(client: TestClient) -> None:
+    response = client.post(
+        "/v1/chat/completions",
+        content=b'{"model": "paddy", "messages": [{"role": "user", "content": "hi"}]}',
+        headers={**_DEFAULT_AUTH, "Content-Type": "text/plain"},
+    )
+    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["type"] == "model_attributes_type"
+    assert error["loc"] == ["body"]
+
+
+@pytest.mark.usefixtures("patched_settings", "fake_agent")
+def test_chat_completions_accepts_json_suffix_content_type(client: TestClient) -> None:
+    response = client.post(
+        "/v1/chat/completions",
+        content=b'{"model": "paddy", "messages": [{"role": "user", "content": "hi"}]}',
+        headers={**_DEFAULT_AUTH, "Content-Type": "application/vnd.api+json; charset=utf-8"},
+    )
+    assert response.status_code == 200
+
+
+def test_chat_completions_request_body_documented(client: TestClient) -> None:
+    spec = client.get("/openapi.json").json()
+    request_body = spec["paths"]["/v1/chat/completions"]["post"]["requestBody"]
+    schema = request_body["content"]["application/json"]["schema"]
+
+    assert request_body["required"] is True
+    assert schema["title"] == "ChatCompletionRequest"
+    assert schema["properties"]["messages"]["items"]["title"] == "ChatMessage"
+
+
 def test_cors_headers_for_obsidian_origin(client: TestClient) -> None:
     response = client.options(
         "/v1/chat/completions",
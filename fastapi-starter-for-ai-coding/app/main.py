@@ -5,22 +5,23 @@ This module creates and configures the FastAPI application with:
 - Structured logging setup
 - Request/response middleware
 - CORS support
-- Agent tool registration
-- Health check endpoints
+- Health check interceptor
 - Global exception handlers
 - Root API endpoint
 """
 
-import importlib
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
+import orjson
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 
+from app.core.agent import warm_up_agent
 from app.core.config import get_settings
 from app.core.exceptions import setup_exception_handlers
-from app.core.health import router as health_router
+from app.core.health_interceptor import HealthCheckInterceptor
 from app.core.logging import get_logger, setup_logging
 from app.core.middleware import setup_middleware
 from app.features.chat.routes import router as chat_router
@@ -33,7 +34,8 @@ async def lifespan(_application: FastAPI) -> AsyncIterator[None]:
     """Application lifespan event handler.
 
     Handles startup and shutdown logic:
-    - Startup: Configure logging, validate vault configuration, log application start
+    - Startup: Configure logging, warm up the agent (if enabled),
+      validate vault configuration, log application start
     - Shutdown: Log application shutdown
 
     Args:
@@ -44,6 +46,8 @@ async def lifespan(_application: FastAPI) -> AsyncIterator[None]:
     """
     # Startup
     setup_logging(log_level=settings.log_level)
+    if settings.agent_warm_up:
+        warm_up_agent()
     logger = get_logger(__name__)
     logger.info(
         "application.lifecycle_started",
@@ -62,35 +66,46 @@ async def lifespan(_application: FastAPI) -> AsyncIterator[None]:
     logger.info("application.lifecycle_stopped", app_name=settings.app_name)
 
 
-application = FastAPI(
+fastapi_app = FastAPI(
     title=settings.app_name,
     version=settings.version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-setup_middleware(application)
+setup_middleware(fastapi_app)
 
-setup_exception_handlers(application)
+setup_exception_handlers(fastapi_app)
 
-# Side-effect import: registers ping tool on vault_agent via @vault_agent.tool decorator
-importlib.import_module("app.features.ping.tools")
+fastapi_app.include_router(chat_router)
 
-application.include_router(health_router)
-application.include_router(chat_router)
+
+# Static for the process lifetime, so serialized once at import
+_ROOT_BODY = orjson.dumps(
+    {
+        "message": settings.app_name,
+        "version": settings.version,
+        "docs": "/docs",
+    }
+)
 
 
-@application.get("/")
-def read_root() -> dict[str, str]:
+@fastapi_app.get("/")
+async def read_root() -> Response:
     """Root endpoint providing API information.
 
+    The body is pre-serialized; a new ``Response`` is still built per
+    request because the request logging middleware writes X-Request-ID
+    into the header list of the response it sends.
+
     Returns:
-        Dict containing application name, version, and docs URL.
+        JSON response with application name, version, and docs URL.
     """
-    return {
-        "message": settings.app_name,
-        "version": settings.version,
-        "docs": "/docs",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+
+# Health probes are answered here, ahead of the middleware stack and routing.
+application = HealthCheckInterceptor(fastapi_app)
 
 
 if __name__ == "__main__":
@@ -6,8 +6,12 @@ This adapter is shared because it will serve both the non-streaming
 and future streaming chat endpoints.
 """
 
-import uuid
+import logging
+import secrets
+import time
 
+import orjson
+from fastapi import Response
 from pydantic_ai.messages import (
     ModelMessage,
     ModelRequest,
@@ -17,17 +21,20 @@ from pydantic_ai.messages import (
 )
 
 from app.core.logging import get_logger
-from app.features.chat.models import (
-    ChatCompletionResponse,
-    ChatMessage,
-    Choice,
-    ResponseMessage,
-    Usage,
-)
-from app.shared.utils import utcnow
+from app.features.chat.models import ChatMessage
 
 logger = get_logger(__name__)
 
+# ChatCompletionResponse rendered with placeholders for the per-request
+# fields: id suffix, created, model, content and the three token counts.
+# Strings are spliced in as orjson-encoded JSON literals.
+_RESPONSE_TEMPLATE = (
+    b'{"id":"chatcmpl-%s","object":"chat.completion","created":%d,"model":%s,'
+    b'"choices":[{"index":0,"message":{"role":"assistant","content":%s},'
+    b'"finish_reason":"stop"}],'
+    b'"usage":{"prompt_tokens":%d,"completion_tokens":%d,"total_tokens":%d}}'
+)
+
 
 def openai_messages_to_pydantic(
     messages: list[ChatMessage],
@@ -55,36 +62,33 @@ def openai_messages_to_pydantic(
     if not messages:
         raise ValueError("Messages array must not be empty.")
 
-    user_prompt: str | None = None
+    last_user_idx = -1
     system_skipped = 0
-    prior_messages: list[ChatMessage] = []
-
-    for msg in reversed(messages):
-        if msg.role == "user" and user_prompt is None:
-            user_prompt = msg.text_content
+    for i, msg in enumerate(messages):
+        if msg.role == "user":
+            last_user_idx = i
         elif msg.role == "system":
             system_skipped += 1
-        else:
-            prior_messages.append(msg)
 
-    if user_prompt is None:
+    if last_user_idx < 0:
         raise ValueError("Messages must contain at least one user message.")
 
-    prior_messages.reverse()
-
-    history: list[ModelMessage] = []
-    for msg in prior_messages:
-        if msg.role == "user":
-            history.append(ModelRequest(parts=[UserPromptPart(content=msg.text_content)]))
-        elif msg.role == "assistant":
-            history.append(ModelResponse(parts=[TextPart(content=msg.text_content)]))
-
-    logger.info(
-        "adapter.openai.messages_converted",
-        total_messages=len(messages),
-        history_messages=len(history),
-        system_messages_skipped=system_skipped,
-    )
+    user_prompt = messages[last_user_idx].text_content
+    history: list[ModelMessage] = [
+        ModelRequest(parts=[UserPromptPart(content=msg.text_content)])
+        if msg.role == "user"
+        else ModelResponse(parts=[TextPart(content=msg.text_content)])
+        for i, msg in enumerate(messages)
+        if i != last_user_idx and msg.role != "system"
+    ]
+
+    if logger.is_enabled_for(logging.INFO):
+        logger.info(
+            "adapter.openai.messages_converted",
+            total_messages=len(messages),
+            history_messages=len(history),
+            system_messages_skipped=system_skipped,
+        )
 
     return user_prompt, history
 
@@ -95,9 +99,15 @@ def build_chat_response(
     request_tokens: int | None = None,
     response_tokens: int | None = None,
     total_tokens: int | None = None,
-) -> ChatCompletionResponse:
+) -> Response:
     """Build an OpenAI-compatible chat completion response.
 
+    The response shape is static, so the body is produced by splicing the
+    per-request fields into a pre-rendered template instead of building
+    and serializing a ``ChatCompletionResponse``. The route returns the
+    result as-is: FastAPI skips response-model validation and
+    ``jsonable_encoder`` for ``Response`` instances.
+
     Args:
         output: The agent's text output.
         model: The model name to echo back in the response.
@@ -106,23 +116,15 @@ def build_chat_response(
         total_tokens: Total token count (from agent usage).
 
     Returns:
-        A ``ChatCompletionResponse`` ready for JSON serialization.
+        A JSON ``Response`` whose body matches ``ChatCompletionResponse``.
     """
-    response_id = f"chatcmpl-{uuid.uuid4().hex[:29]}"
-    created = int(utcnow().timestamp())
-
-    return ChatCompletionResponse(
-        id=response_id,
-        created=created,
-        model=model,
-        choices=[
-            Choice(
-                message=ResponseMessage(content=output),
-            ),
-        ],
-        usage=Usage(
-            prompt_tokens=request_tokens or 0,
-            completion_tokens=response_tokens or 0,
-            total_tokens=total_tokens or 0,
-        ),
+    body = _RESPONSE_TEMPLATE % (
+        secrets.token_hex(15)[:29].encode(),
+        int(time.time()),
+        orjson.dumps(model),
+        orjson.dumps(output),
+        request_tokens or 0,
+        response_tokens or 0,
+        total_tokens or 0,
     )
+    return Response(content=body, media_type="application/json")
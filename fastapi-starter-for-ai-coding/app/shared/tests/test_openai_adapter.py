@@ -1,10 +1,23 @@
 """Unit tests for the OpenAI ↔ Pydantic AI message adapter."""
 
+import json
+from unittest.mock import patch
+
 import pytest
 from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
 
-from app.features.chat.models import ChatMessage, ContentPart
-from app.shared.openai_adapter import build_chat_response, openai_messages_to_pydantic
+from app.features.chat.models import (
+    ChatCompletionResponse,
+    ChatMessage,
+    Choice,
+    ContentPart,
+    ResponseMessage,
+    Usage,
+)
+from app.shared.openai_adapter import (
+    build_chat_response,
+    openai_messages_to_pydantic,
+)
 
 
 def test_single_user_message():
@@ -46,6 +59,20 @@ def test_system_messages_ignored():
     assert history == []
 
 
+def test_messages_after_last_user_kept_in_history():
+    messages = [
+        ChatMessage(role="user", content="Question"),
+        ChatMessage(role="assistant", content="Partial answer"),
+    ]
+    prompt, history = openai_messages_to_pydantic(messages)
+
+    assert prompt == "Question"
+    assert len(history) == 1
+    assert isinstance(history[0], ModelResponse)
+    assert isinstance(history[0].parts[0], TextPart)
+    assert history[0].parts[0].content == "Partial answer"
+
+
 def test_array_content_normalized():
     messages = [
         ChatMessage(
@@ -62,6 +89,15 @@ def test_array_content_normalized():
     assert prompt == "Describe this image"
 
 
+def test_conversion_log_skipped_when_info_disabled():
+    messages = [ChatMessage(role="user", content="Hello")]
+    with patch("app.shared.openai_adapter.logger") as mock_logger:
+        mock_logger.is_enabled_for.return_value = False
+        openai_messages_to_pydantic(messages)
+
+    mock_logger.info.assert_not_called()
+
+
 def test_empty_messages_raises():
     with pytest.raises(ValueError, match="must not be empty"):
         openai_messages_to_pydantic([])
@@ -77,13 +113,14 @@ def test_no_user_message_raises():
 
 
 def test_build_chat_response_structure():
-    resp = build_chat_response(
+    response = build_chat_response(
         output="The answer is 42",
         model="paddy",
         request_tokens=50,
         response_tokens=10,
         total_tokens=60,
     )
+    resp = ChatCompletionResponse.model_validate_json(bytes(response.body))
 
     assert resp.object == "chat.completion"
     assert resp.model == "paddy"
@@ -98,10 +135,54 @@ def test_build_chat_response_structure():
 
 
 def test_build_chat_response_id_format():
-    resp = build_chat_response(output="test", model="paddy")
+    response = build_chat_response(output="test", model="paddy")
+    resp = ChatCompletionResponse.model_validate_json(bytes(response.body))
 
     assert resp.id.startswith("chatcmpl-")
-    assert len(resp.id) > len("chatcmpl-")
+    suffix = resp.id.removeprefix("chatcmpl-")
+    assert len(suffix) == 29
+    int(suffix, 16)
+
+
+def test_build_chat_response_created_is_unix_seconds():
+    with patch("app.shared.openai_adapter.time.time", return_value=1_700_000_000.9):
+        response = build_chat_response(output="test", model="paddy")
+    resp = ChatCompletionResponse.model_validate_json(bytes(response.body))
+
+    assert resp.created == 1_700_000_000
+
+
+def test_build_chat_response_matches_model_dump():
+    """Guard the pre-rendered template against drift from the response model."""
+    response = build_chat_response("Hi", "paddy", 1, 2, 3)
+    data = json.loads(bytes(response.body))
+
+    expected = ChatCompletionResponse(
+        id=data["id"],
+        created=data["created"],
+        model="paddy",
+        choices=[Choice(message=ResponseMessage(content="Hi"))],
+        usage=Usage(prompt_tokens=1, completion_tokens=2, total_tokens=3),
+    )
+    assert data == expected.model_dump()
+
+
+def test_build_chat_response_escapes_strings():
+    output = 'Quote " backslash \\ newline \n unicode é 🚀 </script>'
+    model = 'pa"ddy'
+    response = build_chat_response(output=output, model=model)
+    resp = ChatCompletionResponse.model_validate_json(bytes(response.body))
+
+    assert resp.choices[0].message.content == output
+    assert resp.model == model
+
+
+def test_build_chat_response_is_json_response():
+    response = build_chat_response(output="test", model="paddy")
+
+    assert response.status_code == 200
+    assert response.media_type == "application/json"
+    assert response.headers["content-type"] == "application/json"
 
 
 def test_message_history_alternating_order():
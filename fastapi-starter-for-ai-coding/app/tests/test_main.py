@@ -3,14 +3,15 @@
 from unittest.mock import patch
 
 import pytest
+from fastapi.responses import ORJSONResponse
 from fastapi.testclient import TestClient
 
-from app.main import application
+from app.main import application, fastapi_app, settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client() -> TestClient:
-    """Create a test client for the FastAPI application."""
+    """Create one test client for the FastAPI application, shared by all tests."""
     return TestClient(application)
 
 
@@ -28,6 +29,19 @@ def test_root_endpoint(client: TestClient) -> None:
     assert data["docs"] == "/docs"
 
 
+def test_root_endpoint_returns_preserialized_body(client: TestClient) -> None:
+    """Test / serves its pre-serialized JSON bytes in a plain Response."""
+    response = client.get("/")
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == b'{"message":"Paddy","version":"0.1.0","docs":"/docs"}'
+
+
+def test_app_defaults_to_orjson() -> None:
+    """Test routes returning plain data are rendered with ORJSONResponse."""
+    assert fastapi_app.router.default_response_class is ORJSONResponse
+
+
 def test_docs_endpoint_accessible(client: TestClient) -> None:
     """Test /docs endpoint is accessible."""
     response = client.get("/docs")
@@ -79,6 +93,14 @@ def test_custom_request_id_preserved(client: TestClient) -> None:
     assert response.headers["X-Request-ID"] == custom_id
 
 
+@pytest.mark.parametrize("enabled", [True, False])
+def test_lifespan_agent_warm_up_is_optional(enabled: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test lifespan warms up the agent only when agent_warm_up is set."""
+    monkeypatch.setattr(settings, "agent_warm_up", enabled)
+    with patch("app.main.warm_up_agent") as mock_warm_up, TestClient(application):
+        assert mock_warm_up.called is enabled
+
+
 def test_lifespan_startup_logging() -> None:
     """Test lifespan logs application.lifecycle_started event."""
     with patch("app.main.get_logger") as mock_get_logger: